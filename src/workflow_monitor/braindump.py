@@ -1,14 +1,28 @@
 """Parse Pegasus braindump.yml to locate workflow artifacts."""
 from __future__ import annotations
 
+import glob
+import os
+import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import yaml
 
+from .db import DATACLASS_SLOTS
 
-@dataclass
+# Prefer the libyaml-backed loader when PyYAML was built with it; the
+# pure-Python SafeLoader is an order of magnitude slower.
+try:
+    from yaml import CSafeLoader as _LOADER
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeLoader as _LOADER  # type: ignore[assignment]
+
+_RUN_DIR_RE = re.compile(r"run[0-9]")
+
+
+@dataclass(**DATACLASS_SLOTS)
 class WorkflowInfo:
     wf_uuid: str
     root_wf_uuid: str
@@ -77,12 +91,47 @@ def find_braindump(path: Path) -> Optional[Path]:
     if direct.exists():
         return direct
 
+    # Pegasus lays runs out as <basedir>/<label>/runNNNN/, so probe that
+    # shape first instead of walking every file in the submit tree.
+    latest = _probe_run_dirs(path)
+    if latest is not None:
+        return latest
+
     # Search recursively for braindump.yml files and pick the last (latest run)
-    candidates = sorted(path.rglob("braindump.yml"))
-    if candidates:
-        return candidates[-1]
+    pattern = os.path.join(glob.escape(str(path)), "**", "braindump.yml")
+    found = max(glob.iglob(pattern, recursive=True), default=None)
+    return Path(found) if found is not None else None
+
 
-    return None
+def _subdirs(path: str) -> List[str]:
+    try:
+        with os.scandir(path) as it:
+            return [e.path for e in it if e.is_dir()]
+    except OSError:
+        return []
+
+
+def _probe_run_dirs(path: Path) -> Optional[Path]:
+    """Return the latest ``run*/braindump.yml`` one or two levels below *path*.
+
+    Handles both a label directory (``<label>/runNNNN``) and a base
+    directory (``<basedir>/<label>/runNNNN``).  Returns None when no
+    run directory with a braindump.yml is found.
+    """
+    root = str(path)
+    best: Optional[str] = None
+    for parent in [root] + _subdirs(root):
+        runs = [
+            d for d in _subdirs(parent)
+            if _RUN_DIR_RE.match(os.path.basename(d))
+        ]
+        for run in sorted(runs, reverse=True):
+            candidate = os.path.join(run, "braindump.yml")
+            if os.path.exists(candidate):
+                if best is None or candidate > best:
+                    best = candidate
+                break
+    return Path(best) if best is not None else None
 
 
 def load_braindump(path: Path, remap: str = "auto") -> WorkflowInfo:
@@ -107,8 +156,8 @@ def load_braindump(path: Path, remap: str = "auto") -> WorkflowInfo:
             "Ensure the workflow has been planned with pegasus-plan."
         )
 
-    with open(bd_path) as f:
-        data = yaml.safe_load(f)
+    with open(bd_path, "rb") as f:
+        data = yaml.load(f, Loader=_LOADER)
 
     recorded_submit = Path(data["submit_dir"])
     recorded_basedir = Path(data.get("basedir", recorded_submit.parent))
@@ -9,7 +9,6 @@ from pathlib import Path
 from . import __version__
 from .braindump import load_braindump
 from .db import StampedeDB
-from .display import run_monitor
 
 
 DESCRIPTION = """\
@@ -94,6 +93,14 @@ def build_parser() -> argparse.ArgumentParser:
              "'always' forces rebasing (use for container-planned workflows "
              "viewed from the host); 'never' trusts the recorded path verbatim.",
     )
+    p.add_argument(
+        "--optimize-db",
+        action="store_true",
+        default=False,
+        help="Add a helper index to the stampede database and run ANALYZE "
+             "before monitoring (opens the DB read-write once; polling stays "
+             "read-only)",
+    )
     p.add_argument(
         "--diagnose",
         action="store_true",
@@ -301,6 +308,15 @@ def main(argv: list | None = None) -> int:
         )
         return 1
 
+    # ── Optional one-time index tuning ───────────────────────────────────────
+    if args.optimize_db:
+        import sqlite3
+
+        try:
+            StampedeDB(db_path).optimize()
+        except sqlite3.Error as exc:
+            print(f"[warning] Could not optimize {db_path}: {exc}", file=sys.stderr)
+
     # ── Build condor kwargs ───────────────────────────────────────────────────
     condor_kwargs: dict = {}
     if args.schedd:
@@ -393,6 +409,10 @@ def main(argv: list | None = None) -> int:
         return 0
 
     # ── Run monitor ───────────────────────────────────────────────────────────
+    # Imported here so the Rich dashboard is only loaded once the workflow
+    # and its database have been validated (and never for --serve).
+    from .display import run_monitor
+
     with StampedeDB(db_path, wf_uuid=info.wf_uuid) as db:
         run_monitor(
             info=info,
@@ -1,11 +1,16 @@
 """Query the Pegasus stampede SQLite database for workflow monitoring data."""
 from __future__ import annotations
 
+import itertools
 import sqlite3
+import sys
+import time
+from collections import Counter
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from enum import IntEnum
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 # ─── State helpers ────────────────────────────────────────────────────────────
@@ -29,6 +34,10 @@ _STATE_MAP: Dict[str, str] = {
     "JOB_EVICTED": "HELD",
 }
 
+# Display states that count as "queued" (waiting in HTCondor or running a
+# PRE/POST script)
+_QUEUED_STATES = frozenset({"QUEUED", "PRE", "POST"})
+
 # Rich color per display state
 STATE_STYLE: Dict[str, str] = {
     "SUCCESS": "bold green",
@@ -60,10 +69,42 @@ def display_state(raw_state: Optional[str]) -> str:
     return _STATE_MAP.get(raw_state, raw_state)
 
 
+class DispState(IntEnum):
+    """Display states as small ints, for list-indexed per-row lookups."""
+    SUCCESS = 0
+    FAILED = 1
+    RUNNING = 2
+    QUEUED = 3
+    PRE = 4
+    POST = 5
+    HELD = 6
+    DONE = 7
+    UNKNOWN = 8
+    UNSUBMITTED = 9
+    OTHER = 10  # raw states that display_state() passes through unmapped
+
+
+_DISP_STATE_INDEX: Dict[str, int] = {
+    s.name: int(s) for s in DispState if s is not DispState.OTHER
+}
+
+
+def display_state_index(disp_state: str) -> int:
+    return _DISP_STATE_INDEX.get(disp_state, DispState.OTHER.value)
+
+
+# The formatters below run once per table cell per frame, and finished jobs
+# format the same values on every refresh, so the integer-second cores are
+# memoized.
+
 def fmt_duration(seconds: Optional[float]) -> str:
     if seconds is None or seconds < 0:
         return "-"
-    seconds = int(seconds)
+    return _fmt_duration_int(int(seconds))
+
+
+@lru_cache(maxsize=4096)
+def _fmt_duration_int(seconds: int) -> str:
     if seconds < 60:
         return f"{seconds}s"
     m, s = divmod(seconds, 60)
@@ -76,7 +117,12 @@ def fmt_duration(seconds: Optional[float]) -> str:
 def fmt_timestamp(ts: Optional[float]) -> str:
     if ts is None:
         return "-"
-    return datetime.fromtimestamp(ts).strftime("%H:%M:%S")
+    return _fmt_timestamp_int(int(ts))
+
+
+@lru_cache(maxsize=4096)
+def _fmt_timestamp_int(ts: int) -> str:
+    return time.strftime("%H:%M:%S", time.localtime(ts))
 
 
 def real_exitcode(raw: Optional[int]) -> Optional[int]:
@@ -88,8 +134,13 @@ def real_exitcode(raw: Optional[int]) -> Optional[int]:
     return raw
 
 
+@lru_cache(maxsize=4096)
 def fmt_memory(maxrss_kb: Optional[int]) -> str:
-    """Format maxrss (KB) as human-readable."""
+    """Format maxrss (KB) as human-readable.
+
+    Memoized like fmt_duration: a job's maxrss is fixed once it finishes,
+    so the same values are formatted on every frame.
+    """
     if maxrss_kb is None:
         return "-"
     mb = maxrss_kb / 1024.0
@@ -100,7 +151,16 @@ def fmt_memory(maxrss_kb: Optional[int]) -> str:
 
 # ─── Data classes ─────────────────────────────────────────────────────────────
 
-@dataclass
+# @dataclass keyword arguments for the package's slotted records: slotted
+# instances are smaller and faster to read, which matters for JobRecords
+# rebuilt for every job on every poll.  dataclass(slots=True) needs Python
+# 3.10+, so older interpreters get a plain dataclass.
+DATACLASS_SLOTS: Dict[str, bool] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class JobRecord:
     job_id: int
     exec_job_id: str
@@ -118,24 +178,25 @@ class JobRecord:
     stdout_file: Optional[str] = None
     stderr_file: Optional[str] = None
     maxrss: Optional[int] = None  # peak RSS in KB
+    # Derived once at construction; read many times per frame.
+    disp_state: str = field(init=False)
+    disp_state_idx: int = field(init=False, repr=False)
+    is_compute: bool = field(init=False, repr=False)
 
-    @property
-    def disp_state(self) -> str:
-        return display_state(self.raw_state)
+    def __post_init__(self) -> None:
+        self.disp_state = display_state(self.raw_state)
+        self.disp_state_idx = display_state_index(self.disp_state)
+        self.is_compute = self.type_desc == "compute"
 
     @property
     def duration(self) -> Optional[float]:
         if self.start_time and self.end_time:
             return self.end_time - self.start_time
         if self.start_time and self.disp_state == "RUNNING":
-            now = self._now if self._now is not None else datetime.now().timestamp()
+            now = self._now if self._now is not None else time.time()
             return now - self.start_time
         return None
 
-    @property
-    def is_compute(self) -> bool:
-        return self.type_desc == "compute"
-
     @property
     def short_name(self) -> str:
         """Strip the run-specific ID suffix for cleaner display."""
@@ -151,7 +212,7 @@ class JobRecord:
         return self.exec_job_id
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class WorkflowSnapshot:
     wf_state: str          # WORKFLOW_STARTED | WORKFLOW_TERMINATED | UNKNOWN
     wf_status: Optional[int]   # exit status (0=success)
@@ -159,7 +220,17 @@ class WorkflowSnapshot:
     wf_end: Optional[float]
     jobs: List[JobRecord]
     recent_events: List[Dict]
-    poll_time: float = field(default_factory=lambda: datetime.now().timestamp())
+    poll_time: float = field(default_factory=time.time)
+    # Set by StampedeDB.snapshot(): a new value each time the DB is actually
+    # re-read, so snapshots sharing a revision carry the same job rows and
+    # differ only in the clock.  None when the snapshot was built elsewhere.
+    revision: Optional[int] = None
+    _counts: Optional[Counter[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _split: Optional[Tuple[List[JobRecord], List[JobRecord]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def is_running(self) -> bool:
@@ -184,30 +255,44 @@ class WorkflowSnapshot:
         end = self.wf_end if self.wf_end else self.poll_time
         return end - self.wf_start
 
+    @property
+    def counts(self) -> Counter[str]:
+        """Jobs per display state, computed in a single pass and cached."""
+        if self._counts is None:
+            self._counts = Counter(j.disp_state for j in self.jobs)
+        return self._counts
+
     def job_counts(self) -> Dict[str, int]:
-        counts: Dict[str, int] = {}
-        for job in self.jobs:
-            s = job.disp_state
-            counts[s] = counts.get(s, 0) + 1
-        return counts
+        return dict(self.counts)
+
+    def _partition(self) -> Tuple[List[JobRecord], List[JobRecord]]:
+        """(compute, infra) job lists, split in a single pass and cached."""
+        if self._split is None:
+            compute: List[JobRecord] = []
+            infra: List[JobRecord] = []
+            add_compute, add_infra = compute.append, infra.append
+            for j in self.jobs:
+                (add_compute if j.is_compute else add_infra)(j)
+            self._split = (compute, infra)
+        return self._split
 
     def compute_jobs(self) -> List[JobRecord]:
-        return [j for j in self.jobs if j.is_compute]
+        return self._partition()[0]
 
     def infra_jobs(self) -> List[JobRecord]:
-        return [j for j in self.jobs if not j.is_compute]
+        return self._partition()[1]
 
     def total_jobs(self) -> int:
         return len(self.jobs)
 
     def done_count(self) -> int:
-        return sum(1 for j in self.jobs if j.disp_state == "SUCCESS")
+        return self.counts["SUCCESS"]
 
     def failed_count(self) -> int:
-        return sum(1 for j in self.jobs if j.disp_state == "FAILED")
+        return self.counts["FAILED"]
 
     def held_count(self) -> int:
-        return sum(1 for j in self.jobs if j.disp_state == "HELD")
+        return self.counts["HELD"]
 
     def held_jobs(self) -> List[JobRecord]:
         return [j for j in self.jobs if j.disp_state == "HELD"]
@@ -216,20 +301,44 @@ class WorkflowSnapshot:
         return [j for j in self.jobs if j.disp_state == "FAILED"]
 
     def running_count(self) -> int:
-        return sum(1 for j in self.jobs if j.disp_state == "RUNNING")
+        return self.counts["RUNNING"]
+
+    def unsubmitted_count(self) -> int:
+        return self.counts["UNSUBMITTED"]
 
     def queued_count(self) -> int:
-        return sum(1 for j in self.jobs if j.disp_state in ("QUEUED", "PRE", "POST"))
+        counts = self.counts
+        return sum(counts[s] for s in _QUEUED_STATES)
 
     def progress_pct(self) -> float:
-        total = self.total_jobs()
+        total = len(self.jobs)
         if total == 0:
             return 0.0
-        return 100.0 * self.done_count() / total
+        return 100.0 * self.counts["SUCCESS"] / total
 
 
 # ─── Database class ───────────────────────────────────────────────────────────
 
+# Bounds for the per-connection mmap window (see StampedeDB._apply_pragmas)
+_MMAP_SIZE_MIN = 16 * 1024 * 1024
+_MMAP_SIZE_MAX = 256 * 1024 * 1024
+
+# Helper index + statistics refresh applied by StampedeDB.optimize().  The
+# index covers the per-job "latest state" lookup in get_jobs() and the
+# jobstate aggregation, so each becomes an index-only probe.
+_OPTIMIZE_STATEMENTS = (
+    "CREATE INDEX IF NOT EXISTS idx_js_ji_state_ts ON jobstate("
+    "job_instance_id, state, timestamp DESC, jobstate_submit_seq DESC)",
+    "ANALYZE",
+)
+
+# How long after WORKFLOW_TERMINATED the job table is treated as final
+_TERMINAL_SETTLE_SECONDS = 30.0
+
+# Process-wide so revisions from different StampedeDB instances never collide
+_snapshot_revisions = itertools.count(1)
+
+
 class StampedeDB:
     """Read-only interface to the Pegasus stampede SQLite database."""
 
@@ -238,6 +347,14 @@ class StampedeDB:
         self._wf_uuid = wf_uuid
         self._wf_id: Optional[int] = None
         self._conn: Optional[sqlite3.Connection] = None
+        # Job list of a workflow that has been terminated long enough for
+        # pegasus-monitord to have flushed its final rows; reused by
+        # snapshot() instead of re-running get_jobs().
+        self._terminal_jobs_cache: Optional[List[JobRecord]] = None
+        # Previous snapshot and the data_version it was built from; see
+        # snapshot().
+        self._last_snapshot: Optional[WorkflowSnapshot] = None
+        self._last_data_version: int = -1
 
     # ── Connection management ─────────────────────────────────────────────────
 
@@ -247,8 +364,52 @@ class StampedeDB:
             uri, uri=True, timeout=5.0, check_same_thread=False
         )
         self._conn.row_factory = sqlite3.Row
+        self._apply_pragmas()
         self._resolve_wf_id()
 
+    def _apply_pragmas(self) -> None:
+        """Tune the read-only connection for frequent small polls.
+
+        The same index pages are touched every refresh, so keep them in a
+        larger page cache and let SQLite mmap the file instead of issuing
+        a pread() per page.  The mmap window is sized from the current DB
+        size (with headroom for growth) rather than always reserving the
+        maximum.
+        """
+        conn = self._conn
+        if conn is None:
+            return
+        try:
+            db_size = self.db_path.stat().st_size
+        except OSError:
+            db_size = 0
+        mmap_size = min(_MMAP_SIZE_MAX, max(db_size * 2, _MMAP_SIZE_MIN))
+        try:
+            conn.execute("PRAGMA query_only = 1")
+            conn.execute(f"PRAGMA mmap_size = {int(mmap_size)}")
+            conn.execute("PRAGMA cache_size = -20000")  # ~20 MB
+            conn.execute("PRAGMA temp_store = MEMORY")
+        except sqlite3.DatabaseError:
+            # Tuning is best-effort; the defaults still work.
+            pass
+
+    def optimize(self) -> None:
+        """Add helper indexes to the stampede DB and refresh its statistics.
+
+        Uses a short-lived read-write connection; the polling connection
+        opened by connect() stays read-only.  Raises sqlite3.Error if the
+        database cannot be written (e.g. permissions or a held lock).
+        """
+        conn = sqlite3.connect(
+            f"file:{self.db_path}?mode=rw", uri=True, timeout=5.0
+        )
+        try:
+            for stmt in _OPTIMIZE_STATEMENTS:
+                conn.execute(stmt)
+            conn.commit()
+        finally:
+            conn.close()
+
     def _resolve_wf_id(self) -> None:
         """Look up the integer wf_id for the configured wf_uuid."""
         if self._wf_uuid is None or self._conn is None:
@@ -279,45 +440,127 @@ class StampedeDB:
         return self._conn  # type: ignore[return-value]
 
     # ── Queries ───────────────────────────────────────────────────────────────
-
-    def get_workflow_state(self) -> Dict:
-        cur = self._conn_or_raise().cursor()
-        if self._wf_id is not None:
-            cur.execute(
-                """
-                SELECT state, timestamp, status
-                FROM workflowstate
-                WHERE wf_id = ?
-                ORDER BY timestamp DESC
-                LIMIT 1
-                """,
-                (self._wf_id,),
+    #
+    # SQL text lives in class constants so every poll passes the identical
+    # string to Connection.execute(), which hits sqlite3's per-connection
+    # statement cache instead of re-preparing the statement.
+
+    _SQL_WORKFLOW_TIMES = (
+        "SELECT state, timestamp FROM workflowstate WHERE wf_id = ? ORDER BY timestamp"
+    )
+
+    _SQL_WORKFLOW_TIMES_ANY = (
+        "SELECT state, timestamp FROM workflowstate ORDER BY timestamp"
+    )
+
+    _SQL_WORKFLOW_HISTORY = (
+        "SELECT state, timestamp, status FROM workflowstate"
+        " WHERE wf_id = ? ORDER BY timestamp"
+    )
+
+    _SQL_WORKFLOW_HISTORY_ANY = (
+        "SELECT state, timestamp, status FROM workflowstate ORDER BY timestamp"
+    )
+
+    _SQL_JOBS = """
+        WITH latest_ji AS (
+            SELECT job_id, job_instance_id, exitcode, site,
+                   stdout_file, stderr_file
+            FROM job_instance
+            WHERE (job_id, job_submit_seq) IN (
+                SELECT job_id, MAX(job_submit_seq)
+                FROM job_instance
+                GROUP BY job_id
             )
-        else:
-            cur.execute(
-                """
-                SELECT state, timestamp, status
-                FROM workflowstate
-                ORDER BY timestamp DESC
+        ),
+        -- One pass over jobstate for every job's submit/start/end times
+        -- (across all of its instances) instead of three correlated
+        -- subqueries per job.
+        job_times AS (
+            SELECT
+                ji.job_id,
+                MIN(CASE WHEN js.state = 'SUBMIT' THEN js.timestamp END) AS submit_time,
+                MIN(CASE WHEN js.state = 'EXECUTE' THEN js.timestamp END) AS start_time,
+                MAX(CASE WHEN js.state IN ('JOB_TERMINATED', 'JOB_SUCCESS', 'JOB_FAILURE')
+                         THEN js.timestamp END) AS end_time
+            FROM job_instance ji
+            JOIN jobstate js ON js.job_instance_id = ji.job_instance_id
+            JOIN job jj ON jj.job_id = ji.job_id
+            WHERE (? IS NULL OR jj.wf_id = ?)
+            GROUP BY ji.job_id
+        )
+        SELECT
+            j.job_id,
+            j.exec_job_id,
+            j.type_desc,
+            (
+                SELECT js.state
+                FROM jobstate js
+                WHERE js.job_instance_id = lji.job_instance_id
+                ORDER BY js.timestamp DESC, js.jobstate_submit_seq DESC
                 LIMIT 1
-                """
-            )
-        row = cur.fetchone()
-        if not row:
-            return {"state": "UNKNOWN", "timestamp": None, "status": None}
-        return dict(row)
+            ) AS current_state,
+            lji.exitcode,
+            lji.site,
+            jt.submit_time,
+            jt.start_time,
+            jt.end_time,
+            t.transformation,
+            t.argv AS task_argv,
+            lji.stdout_file,
+            lji.stderr_file,
+            (SELECT MAX(inv.maxrss) FROM invocation inv
+             WHERE inv.job_instance_id = lji.job_instance_id
+               AND inv.task_submit_seq >= 0) AS maxrss
+        FROM job j
+        LEFT JOIN latest_ji lji ON j.job_id = lji.job_id
+        LEFT JOIN job_times jt ON j.job_id = jt.job_id
+        LEFT JOIN task t ON t.job_id = j.job_id
+        WHERE (? IS NULL OR j.wf_id = ?)
+        ORDER BY j.job_id
+        """
+
+    _SQL_EVENTS_SINCE = """
+        SELECT
+            j.exec_job_id,
+            j.type_desc,
+            js.state,
+            js.timestamp,
+            j.job_id,
+            ji.exitcode,
+            ji.stdout_file,
+            ji.stderr_file,
+            (SELECT MAX(inv.maxrss) FROM invocation inv
+             WHERE inv.job_instance_id = ji.job_instance_id
+               AND inv.task_submit_seq >= 0) AS maxrss
+        FROM job j
+        JOIN job_instance ji ON j.job_id = ji.job_id
+        JOIN jobstate js ON ji.job_instance_id = js.job_instance_id
+        WHERE js.timestamp > ?
+          AND (? IS NULL OR j.wf_id = ?)
+        ORDER BY js.timestamp ASC, js.jobstate_submit_seq ASC
+        """
+
+    _SQL_RECENT_EVENTS = """
+        SELECT
+            j.exec_job_id,
+            j.type_desc,
+            js.state,
+            js.timestamp
+        FROM job j
+        JOIN job_instance ji ON j.job_id = ji.job_id
+        JOIN jobstate js ON ji.job_instance_id = js.job_instance_id
+        WHERE (? IS NULL OR j.wf_id = ?)
+        ORDER BY js.timestamp DESC, js.jobstate_submit_seq DESC
+        LIMIT ?
+        """
 
     def get_workflow_times(self) -> Dict:
-        cur = self._conn_or_raise().cursor()
+        conn = self._conn_or_raise()
         if self._wf_id is not None:
-            cur.execute(
-                "SELECT state, timestamp FROM workflowstate WHERE wf_id = ? ORDER BY timestamp",
-                (self._wf_id,),
-            )
+            cur = conn.execute(self._SQL_WORKFLOW_TIMES, (self._wf_id,))
         else:
-            cur.execute(
-                "SELECT state, timestamp FROM workflowstate ORDER BY timestamp"
-            )
+            cur = conn.execute(self._SQL_WORKFLOW_TIMES_ANY)
         start = end = None
         for row in cur.fetchall():
             if row["state"] == "WORKFLOW_STARTED":
@@ -326,158 +569,165 @@ class StampedeDB:
                 end = row["timestamp"]
         return {"start": start, "end": end}
 
-    def get_jobs(self) -> List[JobRecord]:
-        """Return all jobs with their latest observed state and metadata."""
+    def get_workflow_summary(self) -> Dict:
+        """Latest workflow state plus start/end times from one table scan.
+
+        The workflowstate table holds only a handful of rows per workflow,
+        so the latest row and the start/end markers come from one pass.
+        """
+        conn = self._conn_or_raise()
+        if self._wf_id is not None:
+            cur = conn.execute(self._SQL_WORKFLOW_HISTORY, (self._wf_id,))
+        else:
+            cur = conn.execute(self._SQL_WORKFLOW_HISTORY_ANY)
+        summary: Dict = {
+            "state": "UNKNOWN", "timestamp": None, "status": None,
+            "start": None, "end": None,
+        }
+        for state, ts, status in cur.fetchall():
+            summary["state"] = state
+            summary["timestamp"] = ts
+            summary["status"] = status
+            if state == "WORKFLOW_STARTED":
+                summary["start"] = ts
+            elif state == "WORKFLOW_TERMINATED":
+                summary["end"] = ts
+        return summary
+
+    def get_jobs(self, now: Optional[float] = None) -> List[JobRecord]:
+        """Return all jobs with their latest observed state and metadata.
+
+        *now* is stamped onto every record as the reference time for
+        running-job durations, so one frame reads the clock only once.
+        """
+        # Plain tuples for this hot query: unpacking by position is cheaper
+        # than a name lookup per column on sqlite3.Row.  The column order
+        # is fixed by _SQL_JOBS.
         cur = self._conn_or_raise().cursor()
+        cur.row_factory = None
         cur.execute(
-            """
-            WITH latest_ji AS (
-                SELECT job_id, job_instance_id, exitcode, site,
-                       stdout_file, stderr_file
-                FROM job_instance
-                WHERE (job_id, job_submit_seq) IN (
-                    SELECT job_id, MAX(job_submit_seq)
-                    FROM job_instance
-                    GROUP BY job_id
-                )
-            )
-            SELECT
-                j.job_id,
-                j.exec_job_id,
-                j.type_desc,
-                (
-                    SELECT js.state
-                    FROM jobstate js
-                    WHERE js.job_instance_id = lji.job_instance_id
-                    ORDER BY js.timestamp DESC, js.jobstate_submit_seq DESC
-                    LIMIT 1
-                ) AS current_state,
-                lji.exitcode,
-                lji.site,
-                (
-                    SELECT MIN(js.timestamp)
-                    FROM jobstate js
-                    JOIN job_instance ji2 ON js.job_instance_id = ji2.job_instance_id
-                    WHERE ji2.job_id = j.job_id AND js.state = 'SUBMIT'
-                ) AS submit_time,
-                (
-                    SELECT MIN(js.timestamp)
-                    FROM jobstate js
-                    JOIN job_instance ji2 ON js.job_instance_id = ji2.job_instance_id
-                    WHERE ji2.job_id = j.job_id AND js.state = 'EXECUTE'
-                ) AS start_time,
-                (
-                    SELECT MAX(js.timestamp)
-                    FROM jobstate js
-                    JOIN job_instance ji2 ON js.job_instance_id = ji2.job_instance_id
-                    WHERE ji2.job_id = j.job_id
-                      AND js.state IN ('JOB_TERMINATED', 'JOB_SUCCESS', 'JOB_FAILURE')
-                ) AS end_time,
-                t.transformation,
-                t.argv AS task_argv,
-                lji.stdout_file,
-                lji.stderr_file,
-                (SELECT MAX(inv.maxrss) FROM invocation inv
-                 WHERE inv.job_instance_id = lji.job_instance_id
-                   AND inv.task_submit_seq >= 0) AS maxrss
-            FROM job j
-            LEFT JOIN latest_ji lji ON j.job_id = lji.job_id
-            LEFT JOIN task t ON t.job_id = j.job_id
-            WHERE (? IS NULL OR j.wf_id = ?)
-            ORDER BY j.job_id
-            """,
-            (self._wf_id, self._wf_id),
+            self._SQL_JOBS,
+            (self._wf_id, self._wf_id, self._wf_id, self._wf_id),
         )
         jobs = []
-        for row in cur.fetchall():
+        for (
+            job_id, exec_job_id, type_desc, current_state, exitcode, site,
+            submit_time, start_time, end_time, transformation, task_argv,
+            stdout_file, stderr_file, maxrss,
+        ) in cur.fetchall():
             jobs.append(
                 JobRecord(
-                    job_id=row["job_id"],
-                    exec_job_id=row["exec_job_id"],
-                    type_desc=row["type_desc"],
-                    raw_state=row["current_state"],
-                    exitcode=row["exitcode"],
-                    site=row["site"],
-                    submit_time=row["submit_time"],
-                    start_time=row["start_time"],
-                    end_time=row["end_time"],
-                    transformation=row["transformation"],
-                    task_argv=row["task_argv"],
-                    stdout_file=row["stdout_file"],
-                    stderr_file=row["stderr_file"],
-                    maxrss=row["maxrss"],
+                    job_id, exec_job_id, type_desc, current_state, exitcode,
+                    site, submit_time, start_time, end_time,
+                    _now=now,
+                    transformation=transformation,
+                    task_argv=task_argv,
+                    stdout_file=stdout_file,
+                    stderr_file=stderr_file,
+                    maxrss=maxrss,
                 )
             )
         return jobs
 
     def get_events_since(self, after_ts: float) -> List[Dict]:
         """Return all job-state transitions after *after_ts*, ordered ASC."""
-        cur = self._conn_or_raise().cursor()
-        cur.execute(
-            """
-            SELECT
-                j.exec_job_id,
-                j.type_desc,
-                js.state,
-                js.timestamp,
-                j.job_id,
-                ji.exitcode,
-                ji.stdout_file,
-                ji.stderr_file,
-                (SELECT MAX(inv.maxrss) FROM invocation inv
-                 WHERE inv.job_instance_id = ji.job_instance_id
-                   AND inv.task_submit_seq >= 0) AS maxrss
-            FROM job j
-            JOIN job_instance ji ON j.job_id = ji.job_id
-            JOIN jobstate js ON ji.job_instance_id = js.job_instance_id
-            WHERE js.timestamp > ?
-              AND (? IS NULL OR j.wf_id = ?)
-            ORDER BY js.timestamp ASC, js.jobstate_submit_seq ASC
-            """,
-            (after_ts, self._wf_id, self._wf_id),
+        cur = self._conn_or_raise().execute(
+            self._SQL_EVENTS_SINCE, (after_ts, self._wf_id, self._wf_id)
         )
         return [dict(row) for row in cur.fetchall()]
 
     def get_recent_events(self, limit: int = 20) -> List[Dict]:
         """Return the *limit* most recent job-state events."""
-        cur = self._conn_or_raise().cursor()
-        cur.execute(
-            """
-            SELECT
-                j.exec_job_id,
-                j.type_desc,
-                js.state,
-                js.timestamp
-            FROM job j
-            JOIN job_instance ji ON j.job_id = ji.job_id
-            JOIN jobstate js ON ji.job_instance_id = js.job_instance_id
-            WHERE (? IS NULL OR j.wf_id = ?)
-            ORDER BY js.timestamp DESC, js.jobstate_submit_seq DESC
-            LIMIT ?
-            """,
-            (self._wf_id, self._wf_id, limit),
+        cur = self._conn_or_raise().execute(
+            self._SQL_RECENT_EVENTS, (self._wf_id, self._wf_id, limit)
         )
         return [dict(row) for row in cur.fetchall()]
 
+    def _jobs_for_state(self, wf_row: Dict, now: float) -> List[JobRecord]:
+        """Return the job list, skipping the query once the run has settled.
+
+        After WORKFLOW_TERMINATED the job table no longer changes, but
+        monitord may still be flushing the last rows for a short while, so
+        the result is only cached once the termination is older than
+        _TERMINAL_SETTLE_SECONDS.
+        """
+        if wf_row.get("state") != "WORKFLOW_TERMINATED":
+            self._terminal_jobs_cache = None
+            return self.get_jobs(now=now)
+        if self._terminal_jobs_cache is not None:
+            return self._terminal_jobs_cache
+        jobs = self.get_jobs(now=now)
+        end = wf_row.get("end")
+        if end is not None and now - end >= _TERMINAL_SETTLE_SECONDS:
+            self._terminal_jobs_cache = jobs
+        return jobs
+
     def snapshot(self) -> WorkflowSnapshot:
-        """Capture a full workflow snapshot in one call."""
+        """Capture a full workflow snapshot in one call.
+
+        All queries run inside a single read transaction so the workflow
+        state, jobs and events come from one consistent view of the DB.
+
+        If nothing has been written to the DB since the previous snapshot
+        of a running workflow (``PRAGMA data_version`` unchanged), that
+        snapshot's data is reused and only the clock is advanced.
+        """
+        now = time.time()
+        conn = self._conn_or_raise()
         try:
-            wf_row = self.get_workflow_state()
-            wf_times = self.get_workflow_times()
-            jobs = self.get_jobs()
-            events = self.get_recent_events()
+            conn.execute("BEGIN")
+            try:
+                version = conn.execute("PRAGMA data_version").fetchone()[0]
+                last = self._last_snapshot
+                if (last is not None and last.is_running
+                        and self._last_data_version == version):
+                    return self._advance_snapshot(last, now)
+                wf_row = self.get_workflow_summary()
+                jobs = self._jobs_for_state(wf_row, now)
+                events = self.get_recent_events()
+            finally:
+                if conn.in_transaction:
+                    conn.commit()
         except sqlite3.OperationalError:
             # DB may be locked momentarily; return a minimal snapshot
-            wf_row = {"state": "UNKNOWN", "timestamp": None, "status": None}
-            wf_times = {"start": None, "end": None}
-            jobs = []
-            events = []
+            self._last_snapshot = None
+            return WorkflowSnapshot(
+                wf_state="UNKNOWN",
+                wf_status=None,
+                wf_start=None,
+                wf_end=None,
+                jobs=[],
+                recent_events=[],
+                poll_time=now,
+            )
 
-        return WorkflowSnapshot(
+        snap = WorkflowSnapshot(
             wf_state=wf_row.get("state", "UNKNOWN"),
             wf_status=wf_row.get("status"),
-            wf_start=wf_times.get("start"),
-            wf_end=wf_times.get("end"),
+            wf_start=wf_row.get("start"),
+            wf_end=wf_row.get("end"),
             jobs=jobs,
             recent_events=events,
+            poll_time=now,
+            revision=next(_snapshot_revisions),
+        )
+        self._last_snapshot = snap
+        self._last_data_version = version
+        return snap
+
+    @staticmethod
+    def _advance_snapshot(last: WorkflowSnapshot, now: float) -> WorkflowSnapshot:
+        """Re-issue *last* at time *now* without touching the database."""
+        for job in last.jobs:
+            if job.disp_state == "RUNNING":
+                job._now = now
+        return WorkflowSnapshot(
+            wf_state=last.wf_state,
+            wf_status=last.wf_status,
+            wf_start=last.wf_start,
+            wf_end=last.wf_end,
+            jobs=last.jobs,
+            recent_events=last.recent_events,
+            poll_time=now,
+            revision=last.revision,
         )
@@ -1,10 +1,14 @@
 """Rich-based terminal dashboard for live workflow monitoring."""
 from __future__ import annotations
 
+import heapq
+import io
+import threading
 import time
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from rich import box
 from rich.align import Align
@@ -15,6 +19,7 @@ from rich.live import Live
 from rich.panel import Panel
 from rich.progress import BarColumn, Progress, TextColumn
 from rich.rule import Rule
+from rich.style import Style
 from rich.table import Table
 from rich.text import Text
 
@@ -22,6 +27,7 @@ from .braindump import WorkflowInfo
 from .db import (
     STATE_STYLE,
     JOB_TYPE_LABEL,
+    DispState,
     StampedeDB,
     WorkflowSnapshot,
     fmt_duration,
@@ -33,6 +39,7 @@ from .diagnostics import collect_diagnostics
 from .event_log import EventLogger
 from .stats import WorkflowStats, compute_workflow_stats
 from .htcondor_poll import (
+    QUEUE_CACHE_TTL,
     query_queue,
     query_history,
     query_slots,
@@ -50,6 +57,37 @@ from .htcondor_poll import (
 
 # ─── Workflow state styling ───────────────────────────────────────────────────
 
+# Per-row cells use pre-parsed Style objects so Rich does not re-parse the
+# same style strings for every job on every frame.
+_STATE_STYLE_OBJ: Dict[str, Style] = {
+    state: Style.parse(style) for state, style in STATE_STYLE.items()
+}
+_STYLE_NONE = Style.null()
+_STYLE_DIM = Style.parse("dim")
+_STYLE_EXIT_OK = Style.parse("green")
+_STYLE_EXIT_FAIL = Style.parse("red")
+
+# The same styles as lists indexed by JobRecord.disp_state_idx, one per
+# fallback used for states without an entry in STATE_STYLE.
+_STATE_STYLE_ARR: List[Style] = [
+    _STATE_STYLE_OBJ.get(s.name, _STYLE_NONE) for s in DispState
+]
+_STATE_STYLE_ARR_DIM: List[Style] = [
+    _STATE_STYLE_OBJ.get(s.name, _STYLE_DIM) for s in DispState
+]
+
+# Panel titles are built once instead of parsing markup for every Panel;
+# Panel copies its title Text when rendering, so sharing them is safe.
+_TITLE_STATUS = Text("Workflow Status", style="bold")
+_TITLE_COMPUTE = Text("Compute Jobs", style="bold")
+_TITLE_ALL = Text("All Jobs", style="bold")
+_TITLE_EVENTS = Text("Recent Events", style="bold")
+_TITLE_INFRA = Text("Auxiliary Jobs", style="bold")
+_TITLE_POOL = Text("Pool Resources", style="bold")
+_TITLE_DIAGNOSTICS = Text("Diagnostics", style="bold yellow")
+_TITLE_STALL = Text("STALL DETECTED", style="bold red")
+
+
 def _wf_state_text(snap: WorkflowSnapshot) -> Text:
     if snap.is_running:
         return Text("● RUNNING", style="bold cyan")
@@ -127,6 +165,14 @@ def _make_header(
 
 # ─── Status summary bar ───────────────────────────────────────────────────────
 
+# Progress bar segments are sliced from these instead of built by repetition
+_BAR_WIDTH = 40
+_BAR_FULL = "█" * _BAR_WIDTH
+_BAR_EMPTY = "░" * _BAR_WIDTH
+_STYLE_BAR_DONE = Style.parse("bold green")
+_STYLE_BAR_FAIL = Style.parse("bold red")
+
+
 def _make_status_bar(snap: WorkflowSnapshot) -> Panel:
     done = snap.done_count()
     total = snap.total_jobs()
@@ -136,24 +182,22 @@ def _make_status_bar(snap: WorkflowSnapshot) -> Panel:
     held = snap.held_count()
     running = snap.running_count()
     queued = snap.queued_count()
-    unsubmitted = sum(
-        1 for j in snap.jobs if j.disp_state == "UNSUBMITTED"
-    )
+    unsubmitted = snap.unsubmitted_count()
 
     # Progress bar (manual Rich progress widget would need a separate task;
     # we render a simple bar using block characters instead)
-    bar_width = 40
+    bar_width = _BAR_WIDTH
     filled = int(bar_width * pct / 100)
     bar_text = Text()
-    bar_text.append("[", style="dim")
-    bar_text.append("█" * filled, style="bold green")
+    bar_text.append("[", style=_STYLE_DIM)
+    bar_text.append(_BAR_FULL[:filled], style=_STYLE_BAR_DONE)
     if failed > 0:
         fail_filled = max(1, int(bar_width * failed / total)) if total else 0
-        bar_text.append("█" * min(fail_filled, bar_width - filled), style="bold red")
-        bar_text.append("░" * max(0, bar_width - filled - fail_filled), style="dim")
+        bar_text.append(_BAR_FULL[:min(fail_filled, bar_width - filled)], style=_STYLE_BAR_FAIL)
+        bar_text.append(_BAR_EMPTY[:max(0, bar_width - filled - fail_filled)], style=_STYLE_DIM)
     else:
-        bar_text.append("░" * (bar_width - filled), style="dim")
-    bar_text.append("]", style="dim")
+        bar_text.append(_BAR_EMPTY[:bar_width - filled], style=_STYLE_DIM)
+    bar_text.append("]", style=_STYLE_DIM)
 
     grid = Table.grid(expand=True, padding=(0, 2))
     grid.add_column(no_wrap=True)
@@ -188,7 +232,7 @@ def _make_status_bar(snap: WorkflowSnapshot) -> Panel:
     combined.add_row(grid)
     combined.add_row(progress_row)
 
-    return Panel(combined, title="[bold]Workflow Status[/bold]", padding=(0, 1))
+    return Panel(combined, title=_TITLE_STATUS, padding=(0, 1))
 
 
 # ─── Job details table ────────────────────────────────────────────────────────
@@ -217,20 +261,14 @@ def _make_job_table(
     sort_by_activity: bool = True,
 ) -> Panel:
     # Build a condor lookup by DAGNodeName -> status
-    condor_map: dict = {}
-    if condor_jobs:
-        for cj in condor_jobs:
-            node = cj.get("DAGNodeName", "")
-            if node:
-                condor_map[node] = cj
+    condor_map: dict = {
+        node: cj for cj in condor_jobs or () if (node := cj.get("DAGNodeName"))
+    }
 
     # Build a history lookup by DAGNodeName -> ClassAd
-    history_map: dict = {}
-    if condor_history:
-        for hj in condor_history:
-            node = hj.get("DAGNodeName", "")
-            if node:
-                history_map[node] = hj
+    history_map: dict = {
+        node: hj for hj in condor_history or () if (node := hj.get("DAGNodeName"))
+    }
 
     jobs_to_show = snap.jobs if show_all else snap.compute_jobs()
     if sort_by_activity:
@@ -247,35 +285,45 @@ def _make_job_table(
     table.add_column("Type", style="dim", ratio=1, no_wrap=True)
     table.add_column("State", ratio=1, no_wrap=True)
     table.add_column("Exit", justify="right", no_wrap=True, ratio=0)
-    table.add_column("Duration", justify="right", no_wrap=True, ratio=1)
+    table.add_column("Duration", justify="right", style="dim", no_wrap=True, ratio=1)
     table.add_column("Args", style="dim", ratio=2, no_wrap=True, max_width=40)
     table.add_column("Mem", justify="right", style="dim", no_wrap=True, width=7)
     table.add_column("Req", style="dim", no_wrap=True, width=12)
     table.add_column("Live", style="dim", ratio=1, no_wrap=True)
 
+    # Bind per-row lookups to locals for the row loop
+    _condor_get = condor_map.get
+    _history_get = history_map.get
+    _label_get = JOB_TYPE_LABEL.get
+    _styles = _STATE_STYLE_ARR
+    _fmt_dur = fmt_duration
+
     for job in jobs_to_show:
-        state_style = STATE_STYLE.get(job.disp_state, "")
+        state_style = _styles[job.disp_state_idx]
         state_cell = Text(job.disp_state, style=state_style)
         ec = real_exitcode(job.exitcode)
         exit_cell = (
-            Text(str(ec), style="green" if ec == 0 else "red")
+            Text(str(ec), style=_STYLE_EXIT_OK if ec == 0 else _STYLE_EXIT_FAIL)
             if ec is not None
-            else Text("-", style="dim")
+            else Text("-", style=_STYLE_DIM)
         )
-        dur_cell = Text(fmt_duration(job.duration), style="dim")
+        # Cells in a dim column with known-safe content are plain strings;
+        # Text is kept where the content needs its own style or may hold
+        # markup-like characters (argv).
+        dur_cell = _fmt_dur(job.duration)
 
         # Task arguments (truncated)
         argv = job.task_argv or ""
         if len(argv) > 37:
             argv = argv[:37] + "..."
-        argv_cell = Text(argv, style="dim")
+        argv_cell = Text(argv)
 
-        mem_cell = Text(fmt_memory(job.maxrss), style="dim")
+        mem_cell = fmt_memory(job.maxrss)
 
         # Condor live info (queue) or history (completed)
-        condor_info = condor_map.get(job.exec_job_id, {})
-        hist_info = history_map.get(job.exec_job_id, {})
-        req_cell = Text("", style="dim")
+        condor_info = _condor_get(job.exec_job_id, {})
+        hist_info = _history_get(job.exec_job_id, {})
+        req_cell = ""
         if condor_info:
             # Job is still in the queue — show live status
             live_parts = []
@@ -294,7 +342,7 @@ def _make_job_table(
             if xfer:
                 live_parts.append(f"io:{xfer}")
             live_cell = Text(" ".join(live_parts), style="cyan")
-            req_cell = Text(format_resources(condor_info), style="dim")
+            req_cell = format_resources(condor_info)
         elif hist_info:
             # Job completed — show post-completion metrics from history
             live_parts = []
@@ -321,11 +369,11 @@ def _make_job_table(
             if restarts is not None and int(restarts) > 1:
                 live_parts.append(f"try#{int(restarts)}")
             live_cell = Text(" ".join(live_parts), style="dim green")
-            req_cell = Text(format_resources(hist_info), style="dim")
+            req_cell = format_resources(hist_info)
         else:
-            live_cell = Text("", style="dim")
+            live_cell = ""
 
-        type_label = JOB_TYPE_LABEL.get(job.type_desc, job.type_desc)
+        type_label = _label_get(job.type_desc, job.type_desc)
 
         table.add_row(
             job.display_name,
@@ -345,7 +393,7 @@ def _make_job_table(
             "", "", "", "", "", "", "", "",
         )
 
-    title = "[bold]Compute Jobs[/bold]" if not show_all else "[bold]All Jobs[/bold]"
+    title = _TITLE_COMPUTE if not show_all else _TITLE_ALL
     return Panel(table, title=title, padding=(0, 0))
 
 
@@ -366,27 +414,26 @@ def _make_events_panel(snap: WorkflowSnapshot, n: int = 15) -> Panel:
     table.add_column("Duration", justify="right", style="dim", no_wrap=True, width=9)
     table.add_column("Mem", justify="right", style="dim", no_wrap=True, width=7)
 
-    # Show jobs sorted by most recent activity (end_time or start_time)
-    active_jobs = [
-        j for j in snap.jobs
-        if j.raw_state is not None  # only jobs that have been submitted
-    ]
-    active_jobs.sort(
+    # Show the n jobs with the most recent activity (end_time or start_time).
+    # nlargest keeps only n candidates instead of sorting every job.
+    recent = heapq.nlargest(
+        n,
+        (j for j in snap.jobs
+         if j.raw_state is not None),  # only jobs that have been submitted
         key=lambda j: j.end_time or j.start_time or j.submit_time or 0,
-        reverse=True,
     )
 
-    for job in active_jobs[:n]:
-        state_style = STATE_STYLE.get(job.disp_state, "dim")
+    _ts = fmt_timestamp
+    _fmt_dur = fmt_duration
+    _styles = _STATE_STYLE_ARR_DIM
+
+    for job in recent:
+        state_style = _styles[job.disp_state_idx]
         state_cell = Text(job.disp_state, style=state_style)
-        start_cell = Text(
-            fmt_timestamp(job.start_time or job.submit_time), style="dim"
-        )
-        end_cell = Text(
-            fmt_timestamp(job.end_time) if job.end_time else "-", style="dim"
-        )
-        dur_cell = Text(fmt_duration(job.duration), style="dim")
-        mem_cell = Text(fmt_memory(job.maxrss), style="dim")
+        start_cell = _ts(job.start_time or job.submit_time)
+        end_cell = _ts(job.end_time) if job.end_time else "-"
+        dur_cell = _fmt_dur(job.duration)
+        mem_cell = fmt_memory(job.maxrss)
 
         table.add_row(
             job.display_name,
@@ -397,25 +444,23 @@ def _make_events_panel(snap: WorkflowSnapshot, n: int = 15) -> Panel:
             mem_cell,
         )
 
-    if not active_jobs:
+    if not recent:
         table.add_row(
             Text("(no activity yet)", style="dim italic"),
             "", "", "", "", "",
         )
 
-    return Panel(table, title="[bold]Recent Events[/bold]", padding=(0, 0))
+    return Panel(table, title=_TITLE_EVENTS, padding=(0, 0))
 
 
 # ─── Infrastructure summary (compact) ────────────────────────────────────────
 
 def _make_infra_summary(snap: WorkflowSnapshot) -> Panel:
-    infra = snap.infra_jobs()
-    counts: dict = {}
-    for job in infra:
-        t = JOB_TYPE_LABEL.get(job.type_desc, job.type_desc)
-        s = job.disp_state
-        key = (t, s)
-        counts[key] = counts.get(key, 0) + 1
+    _label = JOB_TYPE_LABEL.get
+    counts = Counter(
+        (_label(job.type_desc, job.type_desc), job.disp_state)
+        for job in snap.infra_jobs()
+    )
 
     table = Table(box=None, show_header=False, padding=(0, 1))
     table.add_column("Type", style="dim")
@@ -423,13 +468,13 @@ def _make_infra_summary(snap: WorkflowSnapshot) -> Panel:
     table.add_column("Count", justify="right", style="dim")
 
     for (t, s), count in sorted(counts.items()):
-        style = STATE_STYLE.get(s, "dim")
+        style = _STATE_STYLE_OBJ.get(s, _STYLE_DIM)
         table.add_row(t, Text(s, style=style), str(count))
 
     if not counts:
         table.add_row("(none)", "", "")
 
-    return Panel(table, title="[bold]Auxiliary Jobs[/bold]", padding=(0, 0))
+    return Panel(table, title=_TITLE_INFRA, padding=(0, 0))
 
 
 # ─── Pool resources panel ────────────────────────────────────────────────
@@ -492,7 +537,7 @@ def _make_pool_panel(pool: PoolSummary) -> Panel:
     if pool.os_arch:
         table.add_row("Platform", Text(pool.os_arch, style="dim"))
 
-    return Panel(table, title="[bold]Pool Resources[/bold]", padding=(0, 0))
+    return Panel(table, title=_TITLE_POOL, padding=(0, 0))
 
 
 # ─── Diagnostics panel ────────────────────────────────────────────────────
@@ -572,7 +617,7 @@ def _make_diagnostics_panel(
 
     return Panel(
         grid,
-        title="[bold yellow]Diagnostics[/bold yellow]",
+        title=_TITLE_DIAGNOSTICS,
         border_style="yellow",
         padding=(0, 0),
     )
@@ -639,46 +684,86 @@ def _make_stall_alert_panel(
 
     return Panel(
         body,
-        title="[bold red]STALL DETECTED[/bold red]",
+        title=_TITLE_STALL,
         border_style="bold red",
         padding=(0, 1),
     )
 
 
+# ─── Panel cache ──────────────────────────────────────────────────────────────
+
+# Rebuilding the Rich tables dominates per-frame CPU on large workflows, yet
+# most refreshes render exactly the same data.  Each panel built by
+# _update_layout() is memoized on a fingerprint of its inputs; keys hold the
+# input objects themselves, so equality falls back to a value comparison
+# whenever a new object arrives.
+_panel_cache: Dict[str, Tuple[Any, Panel]] = {}
+
+
+def _cached_panel(name: str, key: Any, build: Callable[[], Panel]) -> Panel:
+    hit = _panel_cache.get(name)
+    if hit is not None and hit[0] == key:
+        return hit[1]
+    panel = build()
+    _panel_cache[name] = (key, panel)
+    return panel
+
+
+def _jobs_display_fingerprint(snap: WorkflowSnapshot) -> tuple:
+    """Everything about the job list that the job/events panels display."""
+    if snap.revision is not None:
+        # Same revision means the same rows; only RUNNING durations move,
+        # and those are derived from the snapshot clock.
+        return (
+            snap.revision,
+            int(snap.poll_time) if snap.running_count() else None,
+        )
+    fp = []
+    for j in snap.jobs:
+        dur = j.duration
+        fp.append((
+            j.job_id, j.disp_state, j.exitcode, j.maxrss,
+            j.submit_time, j.start_time, j.end_time,
+            None if dur is None else int(dur),
+        ))
+    return tuple(fp)
+
+
+def _jobs_state_fingerprint(snap: WorkflowSnapshot) -> tuple:
+    """Job identity/state/exit only, for panels that show no durations.
+
+    The diagnostics and infra panels would otherwise be rebuilt every
+    second while any job runs (and diagnostics re-reads stderr/kickstart
+    files from disk on each rebuild).
+    """
+    if snap.revision is not None:
+        # Same revision means the same rows, so nothing these panels show
+        # can have changed.
+        return (snap.revision,)
+    return tuple((j.job_id, j.disp_state, j.exitcode) for j in snap.jobs)
+
+
+def _condor_fingerprint(ads: Optional[List]) -> tuple:
+    # The history cache is a list that grows in place, so its length is
+    # part of the key alongside the list itself.
+    return (ads, len(ads) if ads else 0)
+
+
 # ─── Full layout assembly ─────────────────────────────────────────────────────
 
-def build_layout(
-    info: WorkflowInfo,
+def _layout_shape(
     snap: WorkflowSnapshot,
-    show_all: bool,
-    condor_jobs: Optional[List],
     events_n: int,
-    refresh_ts: float,
-    replay_info: Optional[dict] = None,
-    remote_info: Optional[dict] = None,
-    submit_dir: Optional[Path] = None,
-    condor_history: Optional[List] = None,
     pool_status: Optional[PoolSummary] = None,
     diag_alerts: Optional[List[Dict]] = None,
-    diag_path: Optional[str] = None,
-    sort_by_activity: bool = True,
-) -> Layout:
-    has_issues = snap.held_count() > 0 or snap.failed_count() > 0
-    has_alerts = bool(diag_alerts)
-
-    # Calculate diagnostics panel height based on number of issues
-    diag_height = 0
-    if has_issues:
-        n_issues = snap.held_count() + snap.failed_count()
-        # ~7 lines per issue (header + exitcode + stdout + stderr + exec + suggestions + spacer)
-        diag_height = min(3 + n_issues * 7, 25)
+) -> Tuple[int, int, int, int]:
+    """Sizes of the layout regions: (alert, diagnostics, pool, events).
 
-    layout = Layout()
-    parts = [
-        Layout(name="header", size=4),
-        Layout(name="status", size=5),
-    ]
-    if has_alerts:
+    A size of 0 means the optional region is absent.  Two frames with the
+    same shape can share one Layout tree and only swap leaf contents.
+    """
+    alert_height = 0
+    if diag_alerts:
         # 3 fixed lines + per-finding/suggestion/job lines, capped
         n_lines = 3
         idle = next(
@@ -694,47 +779,196 @@ def build_layout(
             if a.get("event_type") in ("hold_diagnosis", "failure_diagnosis")
         ))
         alert_height = max(5, min(n_lines + 2, 12))
+
+    # Calculate diagnostics panel height based on number of issues
+    diag_height = 0
+    n_issues = snap.held_count() + snap.failed_count()
+    if n_issues:
+        # ~7 lines per issue (header + exitcode + stdout + stderr + exec + suggestions + spacer)
+        diag_height = min(3 + n_issues * 7, 25)
+
+    pool_height = 0
+    if pool_status is not None:
+        pool_height = pool_status.total_gpus > 0 and 9 or 8
+
+    return (alert_height, diag_height, pool_height, events_n + 3)
+
+
+def _init_layout(shape: Tuple[int, int, int, int]) -> Layout:
+    """Build the (empty) Layout tree for a given _layout_shape()."""
+    alert_height, diag_height, pool_height, events_height = shape
+    layout = Layout()
+    parts = [
+        Layout(name="header", size=4),
+        Layout(name="status", size=5),
+    ]
+    if alert_height:
         parts.append(Layout(name="stall_alert", size=alert_height))
-    if has_issues:
+    if diag_height:
         parts.append(Layout(name="diagnostics", size=diag_height))
     parts.append(Layout(name="main"))
-    parts.append(Layout(name="events", size=events_n + 3))
+    parts.append(Layout(name="events", size=events_height))
     layout.split_column(*parts)
 
     # Build the right-side column: infra summary + optional pool resources
-    if pool_status is not None:
+    if pool_height:
         right_col = Layout(name="right_col")
         right_col.split_column(
             Layout(name="infra", ratio=1),
-            Layout(name="pool", size=pool_status.total_gpus > 0 and 9 or 8),
+            Layout(name="pool", size=pool_height),
         )
         layout["main"].split_row(
             Layout(name="jobs", ratio=3),
             right_col,
         )
-        right_col["infra"].update(_make_infra_summary(snap))
-        right_col["pool"].update(_make_pool_panel(pool_status))
     else:
         layout["main"].split_row(
             Layout(name="jobs", ratio=3),
             Layout(name="infra", ratio=1),
         )
-        layout["infra"].update(_make_infra_summary(snap))
+    return layout
+
+
+def _set_leaf(layout: Layout, name: str, panel: Panel) -> bool:
+    leaf = layout[name]
+    if leaf.renderable is panel:
+        return False
+    leaf.update(panel)
+    return True
 
-    layout["header"].update(_make_header(
-        info, snap, refresh_ts,
-        replay_info=replay_info, remote_info=remote_info,
-        stall_active=has_alerts,
+
+def _update_layout(
+    layout: Layout,
+    shape: Tuple[int, int, int, int],
+    info: WorkflowInfo,
+    snap: WorkflowSnapshot,
+    show_all: bool,
+    condor_jobs: Optional[List],
+    events_n: int,
+    refresh_ts: float,
+    replay_info: Optional[dict] = None,
+    remote_info: Optional[dict] = None,
+    submit_dir: Optional[Path] = None,
+    condor_history: Optional[List] = None,
+    pool_status: Optional[PoolSummary] = None,
+    diag_alerts: Optional[List[Dict]] = None,
+    diag_path: Optional[str] = None,
+    sort_by_activity: bool = True,
+) -> bool:
+    """Refresh the leaves of a Layout built by _init_layout(shape).
+
+    Leaves whose panel is unchanged (same cached Panel) are left alone.
+    Returns True if any leaf was replaced.
+    """
+    alert_height, diag_height, pool_height, _ = shape
+    has_alerts = bool(alert_height)
+
+    jobs_fp = _jobs_display_fingerprint(snap)
+    state_fp = _jobs_state_fingerprint(snap)
+    changed = False
+
+    # The header only shows the refresh time to the second
+    header_key = (info, int(refresh_ts), replay_info, remote_info, has_alerts)
+    changed |= _set_leaf(layout, "header", _cached_panel(
+        "header", header_key,
+        lambda: _make_header(
+            info, snap, refresh_ts,
+            replay_info=replay_info, remote_info=remote_info,
+            stall_active=has_alerts,
+        ),
+    ))
+    status_key = (
+        snap.wf_state, snap.wf_status, tuple(sorted(snap.counts.items())),
+        len(snap.jobs), None if snap.elapsed is None else int(snap.elapsed),
+    )
+    changed |= _set_leaf(layout, "status", _cached_panel(
+        "status", status_key, lambda: _make_status_bar(snap),
     ))
-    layout["status"].update(_make_status_bar(snap))
     if has_alerts:
-        layout["stall_alert"].update(_make_stall_alert_panel(diag_alerts, diag_path=diag_path))
-    if has_issues:
-        layout["diagnostics"].update(_make_diagnostics_panel(snap, condor_jobs=condor_jobs, submit_dir=submit_dir))
-    layout["jobs"].update(_make_job_table(snap, show_all=show_all, condor_jobs=condor_jobs, condor_history=condor_history, sort_by_activity=sort_by_activity))
-    layout["events"].update(_make_events_panel(snap, n=events_n))
+        changed |= _set_leaf(layout, "stall_alert", _cached_panel(
+            "stall_alert", (diag_alerts, diag_path),
+            lambda: _make_stall_alert_panel(diag_alerts, diag_path=diag_path),
+        ))
+    if diag_height:
+        diag_key = (state_fp, _condor_fingerprint(condor_jobs), submit_dir)
+        changed |= _set_leaf(layout, "diagnostics", _cached_panel(
+            "diagnostics", diag_key,
+            lambda: _make_diagnostics_panel(snap, condor_jobs=condor_jobs, submit_dir=submit_dir),
+        ))
+    changed |= _set_leaf(layout, "infra", _cached_panel(
+        "infra", state_fp, lambda: _make_infra_summary(snap),
+    ))
+    if pool_height:
+        changed |= _set_leaf(layout, "pool", _cached_panel(
+            "pool", pool_status, lambda: _make_pool_panel(pool_status),
+        ))
+    jobs_key = (
+        jobs_fp, show_all, sort_by_activity,
+        _condor_fingerprint(condor_jobs), _condor_fingerprint(condor_history),
+    )
+    changed |= _set_leaf(layout, "jobs", _cached_panel(
+        "jobs", jobs_key,
+        lambda: _make_job_table(snap, show_all=show_all, condor_jobs=condor_jobs, condor_history=condor_history, sort_by_activity=sort_by_activity),
+    ))
+    changed |= _set_leaf(layout, "events", _cached_panel(
+        "events", (jobs_fp, events_n), lambda: _make_events_panel(snap, n=events_n),
+    ))
+    return changed
 
-    return layout
+
+class LiveLayout:
+    """One dashboard Layout tree reused across the frames of a Live display.
+
+    The tree is built once and only rebuilt when its shape changes (an
+    optional region appears, disappears or resizes); otherwise each frame
+    just swaps the leaves whose panels changed.  The Live display is
+    expected to run with ``auto_refresh=False``: render() redraws it only
+    when something actually changed.
+    """
+
+    def __init__(self, live: Live) -> None:
+        self._live = live
+        self._layout: Optional[Layout] = None
+        self._shape: Optional[Tuple[int, int, int, int]] = None
+
+    def render(
+        self,
+        info: WorkflowInfo,
+        snap: WorkflowSnapshot,
+        show_all: bool,
+        condor_jobs: Optional[List],
+        events_n: int,
+        refresh_ts: float,
+        replay_info: Optional[dict] = None,
+        remote_info: Optional[dict] = None,
+        submit_dir: Optional[Path] = None,
+        condor_history: Optional[List] = None,
+        pool_status: Optional[PoolSummary] = None,
+        diag_alerts: Optional[List[Dict]] = None,
+        diag_path: Optional[str] = None,
+        sort_by_activity: bool = True,
+    ) -> None:
+        shape = _layout_shape(snap, events_n, pool_status, diag_alerts)
+        changed = False
+        if self._layout is None or shape != self._shape:
+            self._layout = _init_layout(shape)
+            self._shape = shape
+            self._live.update(self._layout)
+            changed = True
+        changed |= _update_layout(
+            self._layout, shape, info, snap, show_all, condor_jobs, events_n,
+            refresh_ts,
+            replay_info=replay_info,
+            remote_info=remote_info,
+            submit_dir=submit_dir,
+            condor_history=condor_history,
+            pool_status=pool_status,
+            diag_alerts=diag_alerts,
+            diag_path=diag_path,
+            sort_by_activity=sort_by_activity,
+        )
+        if changed:
+            self._live.refresh()
 
 
 # ─── Monitor loop ─────────────────────────────────────────────────────────────
@@ -797,12 +1031,59 @@ def run_monitor(
         )
         console.print(f"[dim]Diagnostics sidecar: {diag_path}[/dim]")
 
+    # The queue changes slowly relative to stampede.db, so query_queue()
+    # reuses its last result for a couple of poll intervals.
+    _CONDOR_TTL = max(poll_interval * 2, QUEUE_CACHE_TTL)
+
     def _poll_condor() -> List:
         try:
-            return query_queue(constraint=condor_constraint, **ck)
+            return query_queue(constraint=condor_constraint, ttl=_CONDOR_TTL, **ck)
         except Exception:
             return []
 
+    # condor_q runs on a worker thread while the main thread reads
+    # stampede.db, so a refresh costs max(t_db, t_condor) rather than the
+    # sum.  The thread is a daemon so quitting the monitor is never held up
+    # by an in-flight condor_q or a hung schedd RPC.
+    _condor_thread: Optional[threading.Thread] = None
+    _condor_slot: List[List] = []
+    _condor_cache: List = []
+    # Refresh counter, and the refresh on which _condor_thread was started
+    _tick = 0
+    _condor_tick = -1
+
+    def _submit_condor_poll() -> None:
+        nonlocal _condor_thread, _condor_slot, _tick, _condor_tick
+        _tick += 1
+        if _condor_thread is not None:
+            return
+        slot: List[List] = []
+        _condor_slot = slot
+        _condor_tick = _tick
+        _condor_thread = threading.Thread(
+            target=lambda: slot.append(_poll_condor()),
+            name="condor-poll",
+            daemon=True,
+        )
+        _condor_thread.start()
+
+    def _collect_condor_poll() -> List:
+        nonlocal _condor_thread, _condor_cache
+        if _condor_thread is not None:
+            # Only wait for a poll started by this refresh; one left over
+            # from an earlier tick has already had its wait, so a hung
+            # schedd does not slow every later frame.
+            if _condor_tick == _tick:
+                _condor_thread.join(None if once else poll_interval * 2)
+            if _condor_thread.is_alive():
+                # Still running; keep showing the last result and pick
+                # this one up on a later tick.
+                return _condor_cache
+            if _condor_slot:
+                _condor_cache = _condor_slot[0]
+            _condor_thread = None
+        return _condor_cache
+
     # History cache: accumulates completed job records, refreshed every
     # few poll cycles to avoid hammering condor_history each second.
     _history_cache: List = []
@@ -859,8 +1140,9 @@ def run_monitor(
         return _pool_cache
 
     def _refresh() -> tuple:
+        _submit_condor_poll()
         snap = db.snapshot()
-        condor_jobs = _poll_condor()
+        condor_jobs = _collect_condor_poll()
         history = _poll_history()
         pool = _poll_pool()
         ts = time.time()
@@ -885,18 +1167,28 @@ def run_monitor(
 
     if once:
         snap, condor_jobs, history, pool, ts = _refresh()
-        console.print(_make_header(info, snap, ts))
-        console.print(_make_status_bar(snap))
+        # Render the whole report into memory with the terminal's settings,
+        # then hand it to the real stream in a single write.
+        out = Console(
+            file=io.StringIO(),
+            force_terminal=console.is_terminal,
+            color_system=console.color_system,
+            width=console.width,
+        )
+        out.print(_make_header(info, snap, ts))
+        out.print(_make_status_bar(snap))
         if snap.held_count() > 0 or snap.failed_count() > 0:
-            console.print(_make_diagnostics_panel(snap, condor_jobs=condor_jobs, submit_dir=info.submit_dir))
-        console.print(_make_job_table(snap, show_all=show_all, condor_jobs=condor_jobs, condor_history=history, sort_by_activity=sort_by_activity))
+            out.print(_make_diagnostics_panel(snap, condor_jobs=condor_jobs, submit_dir=info.submit_dir))
+        out.print(_make_job_table(snap, show_all=show_all, condor_jobs=condor_jobs, condor_history=history, sort_by_activity=sort_by_activity))
         if snap.infra_jobs():
-            console.print(_make_infra_summary(snap))
+            out.print(_make_infra_summary(snap))
         if pool is not None:
-            console.print(_make_pool_panel(pool))
-        console.print(_make_events_panel(snap, n=events_n))
+            out.print(_make_pool_panel(pool))
+        out.print(_make_events_panel(snap, n=events_n))
         wf_stats = compute_workflow_stats(snap, condor_history=history, pool_status=pool)
-        _print_final_summary(console, snap, condor_jobs=condor_jobs, submit_dir=info.submit_dir, stats=wf_stats)
+        _print_final_summary(out, snap, condor_jobs=condor_jobs, submit_dir=info.submit_dir, stats=wf_stats)
+        console.file.write(out.file.getvalue())
+        console.file.flush()
         if logger is not None:
             logger.close(snap, condor_history=history, pool_status=pool)
         if diag_engine is not None:
@@ -906,39 +1198,36 @@ def run_monitor(
                 pass
         return
 
+    def _render(dash: LiveLayout, snap, condor_jobs, history, pool, ts) -> None:
+        dash.render(
+            info, snap, show_all, condor_jobs, events_n, ts,
+            submit_dir=info.submit_dir,
+            condor_history=history,
+            pool_status=pool,
+            diag_alerts=list(diag_active_alerts) if diag_active_alerts else None,
+            diag_path=str(diag_engine.path) if diag_engine else None,
+            sort_by_activity=sort_by_activity,
+        )
+
+    # Data only changes once per poll, so the screen is redrawn after a
+    # refresh that actually changed something rather than on a timer.
     with Live(
         console=console,
         screen=True,
-        refresh_per_second=2,
+        auto_refresh=False,
         redirect_stderr=False,
     ) as live:
+        dash = LiveLayout(live)
         try:
             while True:
                 snap, condor_jobs, history, pool, ts = _refresh()
-                layout = build_layout(
-                    info, snap, show_all, condor_jobs, events_n, ts,
-                    submit_dir=info.submit_dir,
-                    condor_history=history,
-                    pool_status=pool,
-                    diag_alerts=list(diag_active_alerts) if diag_active_alerts else None,
-                    diag_path=str(diag_engine.path) if diag_engine else None,
-                    sort_by_activity=sort_by_activity,
-                )
-                live.update(layout)
+                _render(dash, snap, condor_jobs, history, pool, ts)
 
                 if snap.is_complete and not snap.is_running:
                     # Give one extra beat for final DB flush from monitord
                     time.sleep(poll_interval)
                     snap, condor_jobs, history, pool, ts = _refresh()
-                    live.update(
-                        build_layout(info, snap, show_all, condor_jobs, events_n, ts,
-                                     submit_dir=info.submit_dir,
-                                     condor_history=history,
-                                     pool_status=pool,
-                                     diag_alerts=list(diag_active_alerts) if diag_active_alerts else None,
-                                     diag_path=str(diag_engine.path) if diag_engine else None,
-                                     sort_by_activity=sort_by_activity)
-                    )
+                    _render(dash, snap, condor_jobs, history, pool, ts)
                     break
 
                 time.sleep(poll_interval)
@@ -22,8 +22,9 @@ from __future__ import annotations
 import json
 import os
 import subprocess
+import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 # HTCondor JobStatus codes
 JOB_STATUS: Dict[int, str] = {
@@ -39,6 +40,99 @@ JOB_STATUS: Dict[int, str] = {
 
 # ─── Python bindings (preferred) ─────────────────────────────────────────────
 
+# Queue attributes fetched from the schedd (bindings and condor_q alike)
+_PROJECTION = (
+    # Identity & status
+    "ClusterId", "ProcId", "JobStatus",
+    "Cmd", "RemoteHost", "QDate", "JobStartDate",
+    "DAGNodeName", "Owner",
+    "HoldReason", "HoldReasonCode",
+    # Resource requests (Tier 1)
+    "RequestCpus", "RequestMemory", "RequestDisk",
+    "RequestGpus",
+    "ImageSize", "NumJobStarts", "AccountingGroup",
+    # File transfer & I/O (Tier 2)
+    "TransferInputSizeMB",
+    "BytesSent", "BytesRecvd",
+)
+
+# Schedd handles are reused for this long, then re-located so a restarted
+# schedd (or one that moved) is picked up.
+_SCHEDD_TTL = 60.0
+
+_ht_modules: Optional[Tuple[Any, ...]] = None
+_schedd_cache: Dict[Tuple[str, str, str], Tuple[float, Any]] = {}
+
+
+def _binding_modules() -> Tuple[Any, ...]:
+    """Importable HTCondor binding modules, legacy htcondor first.
+
+    Resolved on first use rather than at module import: the bindings read
+    their configuration when imported, so callers must get the chance to
+    set credential environment variables first.  Later calls return the
+    memoized tuple.
+    """
+    global _ht_modules
+    if _ht_modules is not None:
+        return _ht_modules
+
+    mods: List[Any] = []
+    try:
+        import htcondor
+        mods.append(htcondor)
+    except ImportError:
+        pass
+    try:
+        import htcondor2
+        mods.append(htcondor2)
+    except ImportError:
+        pass
+    _ht_modules = tuple(mods)
+    return _ht_modules
+
+
+def _get_schedd(
+    ht: Any,
+    schedd_name: Optional[str] = None,
+    collector_host: Optional[str] = None,
+) -> Any:
+    """Return a (cached) Schedd handle from binding module *ht*."""
+    key = (ht.__name__, schedd_name or "", collector_host or "")
+    now = time.monotonic()
+    hit = _schedd_cache.get(key)
+    if hit is not None and now - hit[0] < _SCHEDD_TTL:
+        return hit[1]
+
+    if schedd_name:
+        try:
+            coll = ht.Collector(collector_host or "")
+            schedd_ad = coll.locate(ht.DaemonTypes.Schedd, schedd_name)
+            schedd = ht.Schedd(schedd_ad)
+        except Exception:
+            schedd = ht.Schedd()
+    else:
+        schedd = ht.Schedd()
+    _schedd_cache[key] = (now, schedd)
+    return schedd
+
+
+def _drop_schedd(
+    ht: Any,
+    schedd_name: Optional[str] = None,
+    collector_host: Optional[str] = None,
+) -> None:
+    _schedd_cache.pop((ht.__name__, schedd_name or "", collector_host or ""), None)
+
+
+def _project(ads: Any, attrs: Sequence[str]) -> List[Dict]:
+    """Copy only the projected *attrs* out of each ClassAd.
+
+    ``dict(ad)`` converts every attribute the schedd returned; reading
+    just the projected keys skips the rest.
+    """
+    return [{k: ad[k] for k in attrs if k in ad} for ad in ads]
+
+
 def _try_python_bindings(
     constraint: Optional[str] = None,
     schedd_name: Optional[str] = None,
@@ -51,48 +145,22 @@ def _try_python_bindings(
         os.environ.setdefault("_CONDOR_SEC_TOKEN_DIRECTORY", str(token_path))
 
     # Try legacy htcondor first, then htcondor2
-    for mod_name in ("htcondor", "htcondor2"):
-        try:
-            import importlib
-            ht = importlib.import_module(mod_name)
-        except ImportError:
-            continue
-
+    for ht in _binding_modules():
         try:
             if collector_host:
                 ht.param["COLLECTOR_HOST"] = collector_host
 
-            if schedd_name:
-                try:
-                    coll = ht.Collector(collector_host or "")
-                    schedd_ad = coll.locate(ht.DaemonTypes.Schedd, schedd_name)
-                    schedd = ht.Schedd(schedd_ad)
-                except Exception:
-                    schedd = ht.Schedd()
-            else:
-                schedd = ht.Schedd()
-
-            projection = [
-                # Identity & status
-                "ClusterId", "ProcId", "JobStatus",
-                "Cmd", "RemoteHost", "QDate", "JobStartDate",
-                "DAGNodeName", "Owner",
-                "HoldReason", "HoldReasonCode",
-                # Resource requests (Tier 1)
-                "RequestCpus", "RequestMemory", "RequestDisk",
-                "RequestGpus",
-                "ImageSize", "NumJobStarts", "AccountingGroup",
-                # File transfer & I/O (Tier 2)
-                "TransferInputSizeMB",
-                "BytesSent", "BytesRecvd",
-            ]
-            q_args: Dict[str, Any] = {"projection": projection}
+            schedd = _get_schedd(ht, schedd_name, collector_host)
+
+            q_args: Dict[str, Any] = {"projection": list(_PROJECTION)}
             if constraint:
                 q_args["constraint"] = constraint
 
-            jobs = [dict(ad) for ad in schedd.query(**q_args)]
+            jobs = _project(schedd.query(**q_args), _PROJECTION)
             return jobs
         except Exception:
+            # The cached handle may be stale; re-locate on the next call
+            _drop_schedd(ht, schedd_name, collector_host)
             continue
 
     return None
@@ -100,25 +168,12 @@ def _try_python_bindings(
 
 # ─── subprocess fallback ──────────────────────────────────────────────────────
 
-_SUBPROCESS_ATTRS = [
-    "ClusterId", "ProcId", "JobStatus",
-    "Cmd", "RemoteHost", "QDate", "JobStartDate",
-    "DAGNodeName", "Owner",
-    "HoldReason", "HoldReasonCode",
-    "RequestCpus", "RequestMemory", "RequestDisk",
-    "RequestGpus",
-    "ImageSize", "NumJobStarts", "AccountingGroup",
-    "TransferInputSizeMB",
-    "BytesSent", "BytesRecvd",
-]
-
-
 def _query_via_subprocess(
     constraint: Optional[str] = None,
     schedd_name: Optional[str] = None,
 ) -> List[Dict]:
     """Query HTCondor queue via ``condor_q -json``."""
-    cmd = ["condor_q", "-json", "-attributes", ",".join(_SUBPROCESS_ATTRS)]
+    cmd = ["condor_q", "-json", "-attributes", ",".join(_PROJECTION)]
     if schedd_name:
         cmd += ["-name", schedd_name]
     if constraint:
@@ -141,6 +196,12 @@ def _query_via_subprocess(
 
 # ─── Public interface ─────────────────────────────────────────────────────────
 
+# Last queue result per (constraint, schedd, collector): (monotonic time, jobs)
+_queue_cache: Dict[Tuple[Optional[str], ...], Tuple[float, List[Dict]]] = {}
+
+QUEUE_CACHE_TTL = 5.0
+
+
 def query_queue(
     constraint: Optional[str] = None,
     schedd_name: Optional[str] = None,
@@ -149,12 +210,18 @@ def query_queue(
     cert_path: Optional[str] = None,
     key_path: Optional[str] = None,
     password_file: Optional[str] = None,
+    ttl: float = QUEUE_CACHE_TTL,
 ) -> List[Dict]:
     """Query the HTCondor job queue.
 
     Returns a list of job ClassAd dicts (may be empty).
     Never raises; errors are swallowed silently.
 
+    Results are cached for ``ttl`` seconds per constraint/schedd/collector,
+    so callers polling faster than the queue changes do not fork
+    ``condor_q`` (or hit the schedd) on every refresh.  ``ttl=0`` always
+    queries.
+
     Parameters
     ----------
     constraint:      HTCondor ClassAd expression to filter jobs.
@@ -164,7 +231,13 @@ def query_queue(
     cert_path:       Path to GSI certificate.
     key_path:        Path to GSI private key.
     password_file:   Path to a password file.
+    ttl:             Seconds a previous result for the same query is reused.
     """
+    key = (constraint, schedd_name, collector_host)
+    hit = _queue_cache.get(key)
+    if hit is not None and time.monotonic() - hit[0] < ttl:
+        return hit[1]
+
     # Apply credential environment variables
     if cert_path:
         os.environ["X509_USER_CERT"] = str(cert_path)
@@ -182,11 +255,12 @@ def query_queue(
         collector_host=collector_host,
         token_path=token_path,
     )
-    if result is not None:
-        return result
+    if result is None:
+        # Fall back to subprocess
+        result = _query_via_subprocess(constraint=constraint, schedd_name=schedd_name)
 
-    # Fall back to subprocess
-    return _query_via_subprocess(constraint=constraint, schedd_name=schedd_name)
+    _queue_cache[key] = (time.monotonic(), result)
+    return result
 
 
 # ─── History attributes (Tier 3) ────────────────────────────────────────────
@@ -215,26 +289,12 @@ def _try_history_bindings(
     if token_path:
         os.environ.setdefault("_CONDOR_SEC_TOKEN_DIRECTORY", str(token_path))
 
-    for mod_name in ("htcondor", "htcondor2"):
-        try:
-            import importlib
-            ht = importlib.import_module(mod_name)
-        except ImportError:
-            continue
-
+    for ht in _binding_modules():
         try:
             if collector_host:
                 ht.param["COLLECTOR_HOST"] = collector_host
 
-            if schedd_name:
-                try:
-                    coll = ht.Collector(collector_host or "")
-                    schedd_ad = coll.locate(ht.DaemonTypes.Schedd, schedd_name)
-                    schedd = ht.Schedd(schedd_ad)
-                except Exception:
-                    schedd = ht.Schedd()
-            else:
-                schedd = ht.Schedd()
+            schedd = _get_schedd(ht, schedd_name, collector_host)
 
             h_args: Dict[str, Any] = {
                 "projection": _HISTORY_ATTRS,
@@ -243,9 +303,10 @@ def _try_history_bindings(
             if constraint:
                 h_args["constraint"] = constraint
 
-            jobs = [dict(ad) for ad in schedd.history(**h_args)]
+            jobs = _project(schedd.history(**h_args), _HISTORY_ATTRS)
             return jobs
         except Exception:
+            _drop_schedd(ht, schedd_name, collector_host)
             continue
 
     return None
@@ -657,13 +718,7 @@ def _try_slots_bindings(
     if token_path:
         os.environ.setdefault("_CONDOR_SEC_TOKEN_DIRECTORY", str(token_path))
 
-    for mod_name in ("htcondor", "htcondor2"):
-        try:
-            import importlib
-            ht = importlib.import_module(mod_name)
-        except ImportError:
-            continue
-
+    for ht in _binding_modules():
         try:
             if collector_host:
                 ht.param["COLLECTOR_HOST"] = collector_host
@@ -673,7 +728,7 @@ def _try_slots_bindings(
                 ht.AdTypes.Startd,
                 projection=_SLOT_ATTRS,
             )
-            return [dict(ad) for ad in ads]
+            return _project(ads, _SLOT_ATTRS)
         except Exception:
             continue
 
@@ -20,7 +20,7 @@ from rich.live import Live
 
 from .braindump import WorkflowInfo
 from .db import JobRecord, WorkflowSnapshot
-from .display import build_layout, _print_final_summary
+from .display import LiveLayout, _print_final_summary
 from .htcondor_poll import PoolSummary
 from .stats import WorkflowStats, compute_workflow_stats
 
@@ -559,16 +559,17 @@ class RemoteEngine:
         with Live(
             console=console,
             screen=True,
-            refresh_per_second=2,
+            auto_refresh=False,
             redirect_stderr=False,
         ) as live:
+            dash = LiveLayout(live)
             try:
                 last_sync = time.time()
 
                 while True:
                     # Update display with current state
                     snap = self._build_snapshot()
-                    layout = build_layout(
+                    dash.render(
                         info, snap, show_all, self._condor_jobs,
                         self._events_n, snap.poll_time,
                         remote_info=remote_info,
@@ -581,7 +582,6 @@ class RemoteEngine:
                         ),
                         sort_by_activity=sort_by_activity,
                     )
-                    live.update(layout)
 
                     if self._workflow_complete:
                         # Hold final state briefly then exit
@@ -11,7 +11,7 @@ from rich.live import Live
 
 from .braindump import WorkflowInfo
 from .db import JobRecord, WorkflowSnapshot
-from .display import build_layout, _print_final_summary
+from .display import LiveLayout, _print_final_summary
 from .htcondor_poll import PoolSummary
 from .stats import WorkflowStats, compute_workflow_stats
 
@@ -367,9 +367,10 @@ class ReplayEngine:
         with Live(
             console=console,
             screen=True,
-            refresh_per_second=4,
+            auto_refresh=False,
             redirect_stderr=False,
         ) as live:
+            dash = LiveLayout(live)
             try:
                 for i, frame in enumerate(frames):
                     frame_ts = float(frame[0].get("timestamp", time.time()))
@@ -392,7 +393,7 @@ class ReplayEngine:
                         )
                     )
 
-                    layout = build_layout(
+                    dash.render(
                         info, snap, show_all, condor_jobs,
                         self._events_n, frame_ts,
                         replay_info=replay_info,
@@ -400,7 +401,6 @@ class ReplayEngine:
                         pool_status=pool_status,
                         sort_by_activity=sort_by_activity,
                     )
-                    live.update(layout)
 
                     # Sleep between frames
                     if i < len(frames) - 1:
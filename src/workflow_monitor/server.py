@@ -19,7 +19,9 @@ from typing import Optional
 from .braindump import WorkflowInfo
 from .db import StampedeDB, WorkflowSnapshot, fmt_duration
 from .event_log import EventLogger
-from .htcondor_poll import query_queue, query_history, query_slots, PoolSummary
+from .htcondor_poll import (
+    QUEUE_CACHE_TTL, query_queue, query_history, query_slots, PoolSummary,
+)
 
 
 def _daemonize(pid_file: Path) -> None:
@@ -135,7 +137,11 @@ def run_server(
 
     def _poll_condor():
         try:
-            return query_queue(constraint=condor_constraint, **ck)
+            return query_queue(
+                constraint=condor_constraint,
+                ttl=max(poll_interval, QUEUE_CACHE_TTL),
+                **ck,
+            )
         except Exception:
             return []
 
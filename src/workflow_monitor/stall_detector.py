@@ -94,7 +94,7 @@ class StallDetector:
         )
         queued = snap.queued_count()
         held = snap.held_count()
-        unsubmitted = sum(1 for j in snap.jobs if j.disp_state == "UNSUBMITTED")
+        unsubmitted = snap.unsubmitted_count()
 
         if total == 0 or unsubmitted == total:
             return None